@@ -16,7 +16,7 @@ from yarl import URL
 
 from .constants import TEAMS
 from .goal import Goal
-from .helper import Team, check_to_post, get_channel_obj, get_team, get_team_role
+from .helper import Team, check_to_post, get_channel_obj, get_team_role, get_teams
 
 if TYPE_CHECKING:
     from .api import Event, Player
@@ -598,8 +598,10 @@ class Game:
 
     async def check_game_state(self, bot: Red, count: int = 0) -> bool:
         # post_state = ["all", self.home_team, self.away_team]
-        home = await get_team(bot, self.home_team, self.game_start_str, self.game_id)
-        await get_team(bot, self.away_team, self.game_start_str, self.game_id)
+        teams = await get_teams(
+            bot, (self.home_team, self.away_team), self.game_start_str, self.game_id
+        )
+        home = teams[self.home_team]
         # ensures that the TeamEntry gets created for both teams to save their data
         try:
             old_game_state = GameState(home["game_state"])
@@ -903,10 +905,9 @@ class Game:
         """
         Checks to see if a goal needs to be posted
         """
-        team_data = {
-            self.home_team: await get_team(bot, self.home_team, self.game_start_str, self.game_id),
-            self.away_team: await get_team(bot, self.away_team, self.game_start_str, self.game_id),
-        }
+        team_data = await get_teams(
+            bot, (self.home_team, self.away_team), self.game_start_str, self.game_id
+        )
         # home_team_data = await get_team(bot, self.home_team)
         # away_team_data = await get_team(bot, self.away_team)
         # all_data = await get_team("all")
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import functools
 import json
 import re
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
@@ -14,7 +16,7 @@ from typing import (
     Literal,
     NamedTuple,
     Optional,
-    Pattern,
+    Set,
     Tuple,
     Union,
 )
@@ -52,20 +54,139 @@ DAY_REF_RE = re.compile(r"(yesterday|tomorrow|today)", re.I)
 YEAR_RE = re.compile(r"((19|20)\d\d)-?\/?((19|20)\d\d)?")
 # https://www.regular-expressions.info/dates.html
 
-TIMEZONE_RE = re.compile(r"|".join(re.escape(zone) for zone in pytz.common_timezones), flags=re.I)
+# Lowercased zone name -> canonical pytz name for exact lookups
+TIMEZONES: Dict[str, str] = {zone.lower(): zone for zone in pytz.common_timezones}
+# Longest first so the fallback search stops on the most specific zone
+TIMEZONE_RE = re.compile(
+    r"|".join(re.escape(zone) for zone in sorted(pytz.common_timezones, key=len, reverse=True)),
+    flags=re.I,
+)
 
 
-ACTIVE_TEAM_RE_STR = r""
+_active_team_names: List[str] = []
 for team, data in TEAMS.items():
     if not data["active"]:
         continue
-    nicks = "|".join(f"\b{n}\b" for n in data["nickname"])
-    ACTIVE_TEAM_RE_STR += rf"\b{team}\b|\b{data['tri_code']}\b|{nicks}"
+    _active_team_names.append(team)
+    _active_team_names.append(data["tri_code"])
+    _active_team_names.extend(data["nickname"])
+# Longest first so e.g. "maple leafs" is preferred over "leafs"
+_active_team_names.sort(key=len, reverse=True)
+ACTIVE_TEAM_RE_STR = r"\b(?:" + r"|".join(re.escape(n) for n in _active_team_names) + r")\b"
 
 ACTIVE_TEAM_RE = re.compile(ACTIVE_TEAM_RE_STR, flags=re.I)
 
+
+def _word_re(word: str) -> str:
+    # lookarounds rather than \b so words ending in punctuation like "St." still match
+    return rf"(?<!\w){re.escape(word)}(?!\w)"
+
+
+# Full team names, tri codes and nicknames mapped back to their team. These are
+# tried first, longest first, so "new york rangers" isn't matched by "new".
+_TEAM_PHRASE_MAP: Dict[str, str] = {}
+_ACTIVE_TEAM_PHRASE_MAP: Dict[str, str] = {}
+# Every single word of a team's name, plus its tri code and nicknames, mapped to
+# the teams using it so TeamFinder can fall back to scoring partial names.
+_TEAM_WORD_MAP: Dict[str, List[str]] = {}
+_ACTIVE_TEAM_WORD_MAP: Dict[str, List[str]] = {}
+for team, data in TEAMS.items():
+    if "Team" in team:
+        continue
+    for phrase in (team, data["tri_code"], *data["nickname"]):
+        _TEAM_PHRASE_MAP.setdefault(phrase.lower(), team)
+        if data["active"]:
+            _ACTIVE_TEAM_PHRASE_MAP.setdefault(phrase.lower(), team)
+    words = (data["tri_code"], *team.split(), *data["nickname"])
+    for word in dict.fromkeys(i.lower() for i in words):
+        _TEAM_WORD_MAP.setdefault(word, []).append(team)
+        if data["active"]:
+            _ACTIVE_TEAM_WORD_MAP.setdefault(word, []).append(team)
+
+
+def _phrase_re(phrases: Iterable[str]) -> re.Pattern:
+    return re.compile(
+        r"|".join(_word_re(i) for i in sorted(phrases, key=len, reverse=True)), flags=re.I
+    )
+
+
+_TEAM_PHRASE_RE = _phrase_re(_TEAM_PHRASE_MAP)
+_ACTIVE_TEAM_PHRASE_RE = _phrase_re(_ACTIVE_TEAM_PHRASE_MAP)
+_TEAM_WORD_RE = _phrase_re(_TEAM_WORD_MAP)
+_ACTIVE_TEAM_WORD_RE = _phrase_re(_ACTIVE_TEAM_WORD_MAP)
+
+
+def _best_team(word_re: re.Pattern, words: Dict[str, List[str]], argument: str) -> Optional[str]:
+    """Returns the team with the most words in `argument`, the earliest match wins a tie"""
+    matched: Dict[str, Set[str]] = {}
+    first_seen: Dict[str, int] = {}
+    for find in word_re.finditer(argument):
+        word = find.group(0).lower()
+        for team in words[word]:
+            matched.setdefault(team, set()).add(word)
+            first_seen.setdefault(team, find.start())
+    if not matched:
+        return None
+    return max(matched, key=lambda t: (len(matched[t]), -first_seen[t]))
+
+
+# Commands where TeamFinder also accepts "all"
+_INCLUDE_ALL_COMMANDS = frozenset(
+    {
+        "hockey gdt setup",
+        "hockey gdc setup",
+        "hockey set add",
+        "hockey otherdiscords",
+        "hockey notifications start",
+        "hockey notifications goal",
+        "hockey notifications state",
+        "hockey notifications defaultstart",
+        "hockey notifications defaultstate",
+        "hockey notifications defaultgoal",
+    }
+)
+# Commands where TeamFinder also accepts inactive teams
+_INCLUDE_INACTIVE_COMMANDS = frozenset({"hockey roster"})
+
+
+def _build_team_choices(
+    include_all: bool, include_inactive: bool
+) -> List[Tuple[str, discord.app_commands.Choice[str]]]:
+    choices = [
+        (t.lower(), discord.app_commands.Choice(name=t, value=t))
+        for t, d in TEAMS.items()
+        if include_inactive or d["active"]
+    ]
+    if include_all:
+        choices.insert(0, ("all", discord.app_commands.Choice(name="All", value="all")))
+    return choices
+
+
+# (include_all, include_inactive) -> [(lowercased name, choice)] for TeamFinder.autocomplete
+_TEAM_CHOICES: Dict[Tuple[bool, bool], List[Tuple[str, discord.app_commands.Choice[str]]]] = {
+    (include_all, include_inactive): _build_team_choices(include_all, include_inactive)
+    for include_all in (True, False)
+    for include_inactive in (True, False)
+}
+
+
 VERSUS_RE = re.compile(r"vs\.?|versus", flags=re.I)
 
+# lowercased search -> (monotonic timestamp, results) shared by PlayerFinder
+# so autocomplete keystrokes and the final transform reuse the same lookup
+_PLAYER_SEARCH_CACHE: Dict[str, Tuple[float, List[SearchPlayer]]] = {}
+_PLAYER_SEARCH_TTL = 300
+_PLAYER_SEARCH_MAX_SIZE = 256
+
+
+def _prune_player_search_cache(now: float) -> None:
+    # drop expired searches first and only start over if they're all still fresh
+    expired = [k for k, v in _PLAYER_SEARCH_CACHE.items() if now - v[0] >= _PLAYER_SEARCH_TTL]
+    for k in expired:
+        del _PLAYER_SEARCH_CACHE[k]
+    if len(_PLAYER_SEARCH_CACHE) >= _PLAYER_SEARCH_MAX_SIZE:
+        _PLAYER_SEARCH_CACHE.clear()
+
 
 @dataclass
 class Team:
@@ -197,9 +318,16 @@ class Broadcast(NamedTuple):
     language: str
 
 
+@functools.lru_cache(maxsize=None)
+def _get_timezone(name: str) -> pytz.BaseTzInfo:
+    return pytz.timezone(name)
+
+
 def utc_to_local(utc_dt: datetime, new_timezone: str = "US/Pacific") -> datetime:
-    eastern = pytz.timezone(new_timezone)
-    return utc_dt.replace(tzinfo=timezone.utc).astimezone(tz=eastern)
+    if utc_dt.tzinfo is None:
+        # naive datetimes are assumed to already be in UTC
+        utc_dt = utc_dt.replace(tzinfo=timezone.utc)
+    return utc_dt.astimezone(tz=_get_timezone(new_timezone))
 
 
 def get_chn_name(game: Game) -> str:
@@ -238,16 +366,35 @@ class DateFinder(discord.app_commands.Transformer):
 
     @classmethod
     async def convert(cls, ctx: Context, argument: str) -> datetime:
-        if argument.lower() == "yesterday":
+        day_ref = argument.lower()
+        if day_ref == "yesterday":
             return datetime.now(timezone.utc) - timedelta(days=1)
-        if argument.lower() == "today":
+        if day_ref == "today":
             return datetime.now(timezone.utc)
-        if argument.lower() == "tomorrow":
+        if day_ref == "tomorrow":
             return datetime.now(timezone.utc) + timedelta(days=1)
+        year, month, day = argument[:4], argument[5:7], argument[8:]
+        if (
+            len(argument) == 10
+            and argument[4] == "-"
+            and argument[7] == "-"
+            and year.isdecimal()
+            and month.isdecimal()
+            and day.isdecimal()
+            and 1900 <= int(year) <= 2099
+        ):
+            # fast path for plain YYYY-MM-DD which is what slash commands send
+            try:
+                return datetime(int(year), int(month), int(day)).astimezone(timezone.utc)
+            except ValueError:
+                pass
         find = DATE_RE.search(argument)
         if find:
-            date_str = f"{find.group(1)}-{find.group(3)}-{find.group(4)}"
-            return datetime.strptime(date_str, "%Y-%m-%d").astimezone(timezone.utc)
+            try:
+                date = datetime(int(find.group(1)), int(find.group(3)), int(find.group(4)))
+            except ValueError:
+                raise BadArgument()
+            return date.astimezone(timezone.utc)
         else:
             raise BadArgument()
 
@@ -264,46 +411,27 @@ class TeamFinder(discord.app_commands.Transformer):
 
     @classmethod
     async def convert(cls, ctx: Context, argument: str) -> str:
-        potential_teams = argument.split()
-        result = set()
-        include_all = ctx.command.qualified_name in [
-            "hockey gdt setup",
-            "hockey gdc setup",
-            "hockey set add",
-            "hockey otherdiscords",
-            "hockey notifications start",
-            "hockey notifications goal",
-            "hockey notifications state",
-            "hockey notifications defaultstart",
-            "hockey notifications defaultstate",
-            "hockey notifications defaultgoal",
-        ]
-        include_inactive = ctx.command.qualified_name in ["hockey roster"]
         if argument in TEAMS.keys():
             return argument
-        for team, data in TEAMS.items():
-            if "Team" in team:
-                continue
-            if not include_inactive and not data["active"]:
-                continue
-            nick = data["nickname"]
-            short = data["tri_code"]
-            pattern = rf"{short}\b|" + r"|".join(rf"\b{i}\b" for i in team.split())
-            if nick:
-                pattern += r"|" + r"|".join(rf"\b{i}\b" for i in nick)
-            # log.debug(pattern)
-            reg: Pattern = re.compile(rf"\b{pattern}", flags=re.I)
-            for pot in potential_teams:
-                find = reg.findall(pot)
-                if find:
-                    log.verbose("TeamFinder reg: %s", reg)
-                    log.verbose("TeamFinder find: %s", find)
-                    result.add(team)
-        if include_all and "all" in argument:
-            result.add("all")
-        if not result:
-            raise BadArgument(_("You must provide a valid current team."))
-        return list(result)[0]
+        command = ctx.command.qualified_name
+        if command in _INCLUDE_INACTIVE_COMMANDS:
+            phrase_re, phrases = _TEAM_PHRASE_RE, _TEAM_PHRASE_MAP
+            word_re, words = _TEAM_WORD_RE, _TEAM_WORD_MAP
+        else:
+            phrase_re, phrases = _ACTIVE_TEAM_PHRASE_RE, _ACTIVE_TEAM_PHRASE_MAP
+            word_re, words = _ACTIVE_TEAM_WORD_RE, _ACTIVE_TEAM_WORD_MAP
+        # a full name or nickname wins over a word shared between teams like "new"
+        find = phrase_re.search(argument)
+        if find:
+            log.verbose("TeamFinder find: %s", find)
+            return phrases[find.group(0).lower()]
+        team = _best_team(word_re, words, argument)
+        if team is not None:
+            log.verbose("TeamFinder best partial match: %s", team)
+            return team
+        if command in _INCLUDE_ALL_COMMANDS and "all" in argument:
+            return "all"
+        raise BadArgument(_("You must provide a valid current team."))
 
     async def transform(self, interaction: discord.Interaction, argument: str) -> str:
         ctx = await interaction.client.get_context(interaction)
@@ -312,40 +440,56 @@ class TeamFinder(discord.app_commands.Transformer):
     async def autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> List[discord.app_commands.Choice[str]]:
-        team_choices = []
-        include_all = interaction.command.name in ["setup", "add", "otherdiscords"]
-        include_inactive = interaction.command.name in ["roster", "games"]
+        include_all = interaction.command.name in ("setup", "add", "otherdiscords")
+        include_inactive = interaction.command.name in ("roster", "games")
+        current = current.lower()
         ret = []
-        for t, d in TEAMS.items():
-            if not include_inactive and not d["active"]:
-                continue
-            team_choices.append(discord.app_commands.Choice(name=t, value=t))
-        if include_all:
-            team_choices.insert(0, discord.app_commands.Choice(name="All", value="all"))
-        for choice in team_choices:
-            if current.lower() in choice.name.lower():
+        for name, choice in _TEAM_CHOICES[(include_all, include_inactive)]:
+            if current in name:
                 ret.append(choice)
-        return ret[:25]
+                if len(ret) == 25:
+                    break
+        return ret
 
 
 class PlayerFinder(discord.app_commands.Transformer):
-    @classmethod
-    async def convert(cls, ctx: Context, argument: str) -> List[SearchPlayer]:
-        cog = ctx.bot.get_cog("Hockey")
+    @staticmethod
+    async def _search_players(cog: Hockey, argument: str) -> List[SearchPlayer]:
+        key = argument.lower()
+        now = time.monotonic()
+        cached = _PLAYER_SEARCH_CACHE.get(key)
+        if cached is not None and now - cached[0] < _PLAYER_SEARCH_TTL:
+            return cached[1]
         players = await cog.api.search_player(argument)
-        ret = []
+        if not players:
+            # an empty result may just be the API having a bad moment
+            return players
+        if len(_PLAYER_SEARCH_CACHE) >= _PLAYER_SEARCH_MAX_SIZE:
+            _prune_player_search_cache(now)
+        _PLAYER_SEARCH_CACHE[key] = (now, players)
+        return players
+
+    @classmethod
+    async def _resolve_players(cls, cog: Hockey, argument: str) -> List[SearchPlayer]:
+        players = await cls._search_players(cog, argument)
+        arg_lc = argument.lower()
+        exact = []
+        others = []
         for player in players:
-            if player.name.lower() == argument.lower():
-                ret.insert(0, player)
+            if player.name.lower() == arg_lc:
+                exact.append(player)
             else:
-                ret.append(player)
-        return ret
+                others.append(player)
+        return exact + others
+
+    @classmethod
+    async def convert(cls, ctx: Context, argument: str) -> List[SearchPlayer]:
+        return await cls._resolve_players(ctx.bot.get_cog("Hockey"), argument)
 
     async def transform(
         self, interaction: discord.Interaction, argument: str
     ) -> List[SearchPlayer]:
-        ctx = await interaction.client.get_context(interaction)
-        return await self.convert(ctx, argument)
+        return await self._resolve_players(interaction.client.get_cog("Hockey"), argument)
 
     async def check_and_download(self, cog: Hockey):
         now = datetime.utcnow()
@@ -387,11 +531,11 @@ class PlayerFinder(discord.app_commands.Transformer):
         self, interaction: discord.Interaction, current: str
     ) -> List[discord.app_commands.Choice]:
         cog = interaction.client.get_cog("Hockey")
-        players = await cog.api.search_player(current)
-        ret = []
-        for player in players:
-            ret.append(discord.app_commands.Choice(name=player.name, value=player.name))
-        return ret[:25]
+        players = await self._search_players(cog, current)
+        return [
+            discord.app_commands.Choice(name=player.name, value=player.name)
+            for player in players[:25]
+        ]
 
 
 class TimezoneFinder(Converter):
@@ -401,9 +545,16 @@ class TimezoneFinder(Converter):
 
     @classmethod
     async def convert(cls, ctx: Context, argument: str) -> str:
+        zone = TIMEZONES.get(argument.lower())
+        if zone:
+            return zone
+        for token in argument.split():
+            zone = TIMEZONES.get(token.lower())
+            if zone:
+                return zone
         find = TIMEZONE_RE.search(argument)
         if find:
-            return find.group(0)
+            return TIMEZONES[find.group(0).lower()]
         else:
             raise BadArgument(
                 _(
@@ -413,6 +564,30 @@ class TimezoneFinder(Converter):
             )
 
 
+_LEADERBOARD_ALIASES: Dict[str, int] = {
+    "seasonal": 3,
+    "season": 3,
+    "weekly": 4,
+    "week": 4,
+    "playoffs": 5,
+    "playoff": 5,
+    "playoffs_weekly": 6,
+    "playoff_weekly": 6,
+    "pre-season": 1,
+    "preseason": 1,
+    "pre-season_weekly": 2,
+    "preseason_weekly": 2,
+    "worst": 0,
+    "worst_playoffs": -2,
+    "worst_preseason": -1,
+    "worst_pre-season": -1,
+    "last_week": 8,
+    "playoffs_last_week": 9,
+    "pre-season_last_week": 7,
+    "preseason_last_week": 7,
+}
+
+
 class LeaderboardType(Enum):
     worst_playoffs = -2
     worst_preseason = -1
@@ -429,33 +604,10 @@ class LeaderboardType(Enum):
 
     @classmethod
     def from_str(cls, name: str) -> LeaderboardType:
-        leaderboard_type = name.replace(" ", "_").lower()
-        if leaderboard_type in ("seasonal", "season"):
-            return LeaderboardType(3)
-        elif leaderboard_type in ("weekly", "week"):
-            return LeaderboardType(4)
-        elif leaderboard_type in ("playoffs", "playoff"):
-            return LeaderboardType(5)
-        elif leaderboard_type in ("playoffs_weekly", "playoff_weekly"):
-            return LeaderboardType(6)
-        elif leaderboard_type in ("pre-season", "preseason"):
-            return LeaderboardType(1)
-        elif leaderboard_type in ("pre-season_weekly", "preseason_weekly"):
-            return LeaderboardType(2)
-        elif leaderboard_type in ("worst",):
-            return LeaderboardType(0)
-        elif leaderboard_type in ("worst_playoffs",):
-            return LeaderboardType(-2)
-        elif leaderboard_type in ("worst_preseason", "worst_pre-season"):
-            return LeaderboardType(-1)
-        elif leaderboard_type in ("last_week",):
-            return LeaderboardType(8)
-        elif leaderboard_type in ("playoffs_last_week",):
-            return LeaderboardType(9)
-        elif leaderboard_type in ("pre-season_last_week", "preseason_last_week"):
-            return LeaderboardType(7)
-        else:
+        value = _LEADERBOARD_ALIASES.get(name.replace(" ", "_").lower())
+        if value is None:
             raise TypeError(_("`{name}` is not a valid leaderboard type.").format(name=name))
+        return LeaderboardType(value)
 
     def is_standard(self):
         return self in (
@@ -514,16 +666,18 @@ class LeaderboardType(Enum):
         }.get(self, "total")
 
 
+_LEADERBOARD_CHOICES: List[Tuple[str, discord.app_commands.Choice[str]]] = [
+    (i.as_str().lower(), discord.app_commands.Choice(name=i.as_str().title(), value=str(i.value)))
+    for i in LeaderboardType
+]
+
+
 class LeaderboardFinder(discord.app_commands.Transformer):
     @classmethod
     async def convert(self, ctx: Context, argument: str) -> LeaderboardType:
         if argument.isdigit():
             return LeaderboardType(int(argument))
-        try:
-            return LeaderboardType.from_str(argument)
-        except TypeError:
-            pass
-        return LeaderboardType(4)
+        return LeaderboardType(_LEADERBOARD_ALIASES.get(argument.replace(" ", "_").lower(), 4))
 
     async def transform(self, interaction: discord.Interaction, argument: str) -> LeaderboardType:
         ctx = interaction.client.get_context(interaction)
@@ -532,11 +686,8 @@ class LeaderboardFinder(discord.app_commands.Transformer):
     async def autocomplete(
         self, interaction: discord.Interaction, argument: str
     ) -> List[discord.app_commands.Choice[str]]:
-        return [
-            discord.app_commands.Choice(name=i.as_str().title(), value=str(i.value))
-            for i in LeaderboardType
-            if argument.lower() in i.as_str().lower()
-        ]
+        argument = argument.lower()
+        return [choice for name, choice in _LEADERBOARD_CHOICES if argument in name]
 
 
 class HockeyStates(Enum):
@@ -547,6 +698,11 @@ class HockeyStates(Enum):
     final = "Final"
 
 
+_STATE_CHOICES: List[discord.app_commands.Choice[str]] = [
+    discord.app_commands.Choice(name=v.name.title(), value=v.value) for v in HockeyStates
+]
+
+
 class StateFinder(discord.app_commands.Transformer):
     @classmethod
     async def convert(cls, ctx: Context, argument: str) -> HockeyStates:
@@ -562,9 +718,7 @@ class StateFinder(discord.app_commands.Transformer):
     async def autocomplete(
         self, interaction: discord.Interaction, value: str
     ) -> List[discord.app_commands.Choice[str]]:
-        return [
-            discord.app_commands.Choice(name=v.name.title(), value=v.value) for v in HockeyStates
-        ]
+        return _STATE_CHOICES
 
 
 class Divisions(Enum):
@@ -579,58 +733,44 @@ class Conferences(Enum):
     Western = "Western"
 
 
+# lowercased division/conference name -> standings search
+_STANDINGS_ALIASES: Dict[str, str] = {
+    "all": "all",
+    "league": "league",
+    **{d.name.lower(): d.name.lower() for d in Divisions},
+    **{c.name.lower(): c.name.lower() for c in Conferences},
+}
+
+_STANDINGS_CHOICES: List[discord.app_commands.Choice[str]] = [
+    discord.app_commands.Choice(name="All", value="all"),
+    discord.app_commands.Choice(name="League", value="league"),
+    *(discord.app_commands.Choice(name=d.name, value=d.name) for d in Divisions),
+    *(discord.app_commands.Choice(name=c.name, value=c.name) for c in Conferences),
+]
+
+
 class StandingsFinder(discord.app_commands.Transformer):
     @classmethod
     async def convert(cls, ctx: Context, argument: str) -> str:
-        ret = ""
-        try:
-            ret = Divisions(argument.title()).name
-        except ValueError:
-            pass
-        try:
-            ret = Conferences(argument.title()).name
-        except ValueError:
-            pass
-        if argument.lower() == "all":
-            ret = "all"
-        if argument.lower() == "league":
-            ret = "league"
+        arg_lc = argument.lower()
+        ret = _STANDINGS_ALIASES.get(arg_lc, "")
         if not ret:
             for division in Divisions:
-                if argument.lower() in division.name.lower():
+                if arg_lc in division.name.lower():
                     ret = division.name
             for conference in Conferences:
-                if argument.lower() in conference.name.lower():
+                if arg_lc in conference.name.lower():
                     ret = conference.name
         return ret.lower()
 
     @classmethod
     async def transform(cls, ctx: Context, argument: str) -> str:
-        ret = ""
-        try:
-            ret = Divisions(argument.title()).name
-        except ValueError:
-            pass
-        try:
-            ret = Conferences(argument.title()).name
-        except ValueError:
-            pass
-        if argument.lower() == "all":
-            ret = "all"
-        if argument.lower() == "league":
-            ret = "league"
-        return ret.lower()
+        return _STANDINGS_ALIASES.get(argument.lower(), "")
 
     async def autocomplete(
         self, interaction: discord.Interaction, argument: str
     ) -> List[discord.app_commands.Choice[str]]:
-        choices = [
-            discord.app_commands.Choice(name="All", value="all"),
-            discord.app_commands.Choice(name="League", value="league"),
-        ]
-        choices += [discord.app_commands.Choice(name=d.name, value=d.name) for d in Divisions]
-        choices += [discord.app_commands.Choice(name=d.name, value=d.name) for d in Conferences]
-        return choices
+        return _STANDINGS_CHOICES
 
 
 def game_states_to_int(states: List[str]) -> List[int]:
@@ -661,21 +801,15 @@ async def check_to_post(
     if channel_teams is None:
         await bot.get_cog("Hockey").config.channel(channel).team.clear()
         return False
-    is_countdown = game_state.value in [2, 3, 4]
+    is_countdown = game_state.value in (2, 3, 4)
     channel_countdown = channel_data["countdown"]
     if is_countdown and channel_countdown is False:
         return False
-    should_post = False
-    state_ints = game_states_to_int(channel_data["game_states"])
-    if game_state.value in state_ints:
-        for team in channel_teams:
-            if team in post_state:
-                should_post = True
-    if is_goal and "Goal" in channel_data["game_states"]:
-        for team in channel_teams:
-            if team in post_state:
-                should_post = True
-    return should_post
+    game_states = channel_data["game_states"]
+    is_wanted_state = game_state.value in game_states_to_int(game_states)
+    if not is_wanted_state and not (is_goal and "Goal" in game_states):
+        return False
+    return not set(post_state).isdisjoint(channel_teams)
 
 
 def get_team_role(guild: discord.Guild, team_name: str) -> Optional[discord.Role]:
@@ -683,50 +817,62 @@ def get_team_role(guild: discord.Guild, team_name: str) -> Optional[discord.Role
     This returns the role mentions if they exist
     Otherwise it returns the name of the team as a str
     """
-    role = discord.utils.get(guild.roles, name=team_name)
-    if role is None and "Canadiens" in team:
-        role = discord.utils.get(guild.roles, neam="Montreal Canadiens")
-    return role
-
+    # Montréal roles are commonly created without the accent so accept both
+    # while only walking the guild's roles once
+    fallback_name = "Montreal Canadiens" if "Canadiens" in team_name else None
+    fallback = None
+    for role in guild.roles:
+        if role.name == team_name:
+            return role
+        if fallback is None and role.name == fallback_name:
+            fallback = role
+    return fallback
+
+
+async def get_teams(
+    bot: Red, teams: Iterable[str], game_start: str, game_id: int = 0
+) -> Dict[str, dict]:
+    """
+    Returns the saved TeamEntry data for each team in a game
 
-async def get_team(bot: Red, team: str, game_start: str, game_id: int = 0) -> dict:
+    Config is read and written at most once no matter how many teams are requested
+    and any teams we haven't seen yet are added to track stats
+    """
     config = bot.get_cog("Hockey").config
     team_list = await config.teams()
     if team_list is None:
         team_list = []
-        team_entry = TeamEntry(
-            game_state=0,
-            team_name=team,
-            period=0,
-            channel=[],
-            goal_id={},
-            created_channel=[],
-            game_start=game_start,
-            game_id=game_id,
-        )
-        team_list.append(team_entry.to_json())
+    index: Dict[str, dict] = {}
+    for entry in team_list:
+        if entry["game_start"] == game_start and entry["game_id"] == game_id:
+            index.setdefault(entry["team_name"], entry)
+    ret = {}
+    missing = False
+    for team in teams:
+        if team not in index:
+            # Add unknown teams to the config to track stats
+            team_entry = TeamEntry(
+                game_state=0,
+                team_name=team,
+                period=0,
+                channel=[],
+                goal_id={},
+                created_channel=[],
+                game_start=game_start,
+                game_id=game_id,
+            ).to_json()
+            team_list.append(team_entry)
+            index[team] = team_entry
+            missing = True
+        ret[team] = index[team]
+    if missing:
         await config.teams.set(team_list)
-    for teams in team_list:
-        if (
-            team == teams["team_name"]
-            and game_start == teams["game_start"]
-            and game_id == teams["game_id"]
-        ):
-            return teams
-    # Add unknown teams to the config to track stats
-    return_team = TeamEntry(
-        game_state=0,
-        team_name=team,
-        period=0,
-        channel=[],
-        goal_id={},
-        created_channel=[],
-        game_start=game_start,
-        game_id=game_id,
-    )
-    team_list.append(return_team.to_json())
-    await config.teams.set(team_list)
-    return return_team.to_json()
+    return ret
+
+
+async def get_team(bot: Red, team: str, game_start: str, game_id: int = 0) -> dict:
+    teams = await get_teams(bot, (team,), game_start, game_id)
+    return teams[team]
 
 
 async def get_channel_obj(
@@ -755,14 +901,13 @@ async def get_channel_obj(
         # log.info(f"{channel_id} channel was removed because it no longer exists")
         log.info("guild ID %s Could not be found", channel_id)
         return None
-    channel = guild.get_channel(channel_id)
-    thread = guild.get_thread(channel_id)
-    if channel is None and thread is None:
+    channel = guild.get_channel_or_thread(channel_id)
+    if channel is None:
         # await bot.get_cog("Hockey").config.channel_from_id(channel_id).clear()
         # log.info(f"{channel_id} channel was removed because it no longer exists")
         log.info("thread or channel ID %s Could not be found", channel_id)
         return None
-    return channel or thread
+    return channel
 
 
 async def slow_send_task(tasks: Iterable[Coroutine]):
@@ -1,6 +1,18 @@
 from __future__ import annotations
 
-from typing import Any, List, Optional
+import asyncio
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+)
 
 import discord
 from red_commons.logging import getLogger
@@ -8,13 +20,13 @@ from red_commons.logging import getLogger
 # from discord.ext.commands.errors import BadArgument
 from redbot.core.commands import commands
 from redbot.core.i18n import Translator
-from redbot.core.utils.chat_formatting import humanize_list
 from redbot.vendored.discord.ext import menus
 
 from .models import (
     Collection,
     EPICData,
     Event,
+    Items,
     ManifestPhoto,
     NASAAstronomyPictureOfTheDay,
     NASATLEFeed,
@@ -23,16 +35,24 @@ from .models import (
     PhotoManifest,
     RoverPhoto,
     TLEMember,
+    quote_url,
 )
 
 log = getLogger("red.Trusty-cogs.NASACog")
 _ = Translator("NASA", __file__)
 
 
+def _page_footers(source: menus.ListPageSource) -> List[str]:
+    """Builds the `Page x/y` footer for every page of a fixed length source"""
+    max_pages = source.get_max_pages()
+    return [f"Page {i + 1}/{max_pages}" for i in range(max_pages)]
+
+
 class NEOFeedPages(menus.ListPageSource):
     def __init__(self, feed: NEOFeed):
         self.feed = feed
         super().__init__(self.feed.near_earth_objects, per_page=1)
+        self._footers = _page_footers(self)
         self.select_options = [
             discord.SelectOption(label=page.name[:100], value=i)
             for i, page in enumerate(self.feed.near_earth_objects)
@@ -40,7 +60,7 @@ class NEOFeedPages(menus.ListPageSource):
 
     async def format_page(self, view: BaseMenu, page: NearEarthObject):
         em = page.embed()
-        em.set_footer(text=f"Page {view.current_page + 1}/{self.get_max_pages()}")
+        em.set_footer(text=self._footers[view.current_page])
         return em
 
 
@@ -48,6 +68,7 @@ class TLEPages(menus.ListPageSource):
     def __init__(self, feed: NASATLEFeed):
         self.feed = feed
         super().__init__(self.feed.member, per_page=1)
+        self._footers = _page_footers(self)
         self.select_options = [
             discord.SelectOption(label=page.name[:100], value=i)
             for i, page in enumerate(self.feed.member)
@@ -55,53 +76,113 @@ class TLEPages(menus.ListPageSource):
 
     async def format_page(self, view: BaseMenu, page: TLEMember):
         em = page.embed()
-        em.set_footer(text=f"Page {view.current_page + 1}/{self.get_max_pages()}")
+        em.set_footer(text=self._footers[view.current_page])
         return em
 
 
 class NASAImagesCollection(menus.ListPageSource):
+    # how long a resolved video link is reused before it's looked up again
+    VIDEO_URL_TTL = 15 * 60
+
     def __init__(self, collection: Collection):
         self.collection = collection
         super().__init__(collection.items, per_page=1)
+        self._footers = _page_footers(self)
         self.select_options = [
             discord.SelectOption(label=page.data[0].title[:100], value=i)
             for i, page in enumerate(collection.items)
         ]
+        # Images never change so render them all up front. Videos need their
+        # media link looked up first so they're rendered when visited.
+        self._embeds: Dict[int, List[discord.Embed]] = {
+            i: self._make_embeds(i, page)
+            for i, page in enumerate(collection.items)
+            if page.data[0].media_type != "video"
+        }
+        # page href -> (time requested, task resolving the video link)
+        self._video_urls: Dict[str, Tuple[float, asyncio.Task]] = {}
+        self._video_semaphore = asyncio.Semaphore(5)
+        self._prefetch_task: Optional[asyncio.Task] = None
+
+    def _make_embeds(
+        self, index: int, page: Items, url: Optional[str] = None
+    ) -> List[discord.Embed]:
+        data = page.data[0]
+        base = {
+            "type": "rich",
+            "title": data.title,
+            "description": data.description,
+            "timestamp": data.date_created.isoformat(),
+            "footer": {"text": self._footers[index]},
+        }
+        if url is not None:
+            base["url"] = url
+        # build each preview from the dict rather than Embed.copy() which
+        # round trips the whole embed through to_dict/from_dict
+        return [
+            discord.Embed.from_dict({**base, "image": {"url": link.href}})
+            for link in page.links
+            if link.rel == "preview"
+        ]
 
-    async def format_page(self, view: BaseMenu, page):
-        url = None
-        if page.data[0].media_type == "video":
-            media_links = []
+    async def _fetch_video_url(self, cog: commands.Cog, href: str) -> Optional[str]:
+        async with self._video_semaphore:
             try:
-                media_links = await view.cog.request(page.href, include_api_key=False)
+                media_links = await cog.request(href, include_api_key=False)
             except Exception:
                 log.exception("Error getting video response data")
-                pass
-            for link in media_links:
-                if link.endswith("orig.mp4"):
-                    url = link.replace(" ", "%20")
-        em = discord.Embed(
-            title=page.data[0].title,
-            description=page.data[0].description,
-            timestamp=page.data[0].date_created,
-            url=url,
+                # forget the failure so the link can be looked up again next time
+                self._video_urls.pop(href, None)
+                return None
+        link = next((link for link in media_links if link.endswith("orig.mp4")), None)
+        return quote_url(link) if link is not None else None
+
+    def _get_video_url(self, cog: commands.Cog, page: Items) -> asyncio.Task:
+        now = time.monotonic()
+        cached = self._video_urls.get(page.href)
+        if cached is not None and now - cached[0] < self.VIDEO_URL_TTL:
+            return cached[1]
+        task = asyncio.create_task(self._fetch_video_url(cog, page.href))
+        self._video_urls[page.href] = (now, task)
+        return task
+
+    async def _prefetch_videos(self, cog: commands.Cog):
+        await asyncio.gather(
+            *(
+                self._get_video_url(cog, page)
+                for page in self.collection.items
+                if page.data[0].media_type == "video"
+            )
         )
-        em.set_footer(text=f"Page {view.current_page + 1}/{self.get_max_pages()}")
-        embeds = []
-        for link in page.links:
-            if link.rel != "preview":
-                continue
-            e = em.copy()
-            e.set_image(url=link.href.replace(" ", "%20"))
-            embeds.append(e)
 
-        return {"embeds": embeds}
+    @staticmethod
+    def _prefetch_done(task: asyncio.Task):
+        # retrieve the result so a failure is logged rather than left unretrieved
+        if not task.cancelled() and task.exception() is not None:
+            log.error("Error prefetching video links", exc_info=task.exception())
+
+    def cancel_prefetch(self):
+        """Stops resolving video links once the menu is no longer in use"""
+        if self._prefetch_task is not None:
+            self._prefetch_task.cancel()
+
+    async def format_page(self, view: BaseMenu, page: Items):
+        if self._prefetch_task is None:
+            # resolve every video in the background so later pages open instantly
+            self._prefetch_task = asyncio.create_task(self._prefetch_videos(view.cog))
+            self._prefetch_task.add_done_callback(self._prefetch_done)
+        index = view.current_page
+        if index in self._embeds:
+            return {"embeds": self._embeds[index]}
+        url = await asyncio.shield(self._get_video_url(view.cog, page))
+        return {"embeds": self._make_embeds(index, page, url)}
 
 
 class MarsRoverManifest(menus.ListPageSource):
     def __init__(self, manifest: PhotoManifest):
         self.manifest = manifest
         super().__init__(manifest.photos, per_page=10)
+        self._footers = _page_footers(self)
         self.select_options = [
             discord.SelectOption(
                 label=f"Page {i+1}",
@@ -111,20 +192,20 @@ class MarsRoverManifest(menus.ListPageSource):
         ]
 
     async def format_page(self, view: BaseMenu, photos: List[ManifestPhoto]):
-        description = ""
-        for photo in photos:
-            description += (
-                f"Sol: {photo.sol} - Earth Date: {photo.earth_date}\n"
-                f"Number of Photos: {photo.total_photos} - Cameras: {humanize_list(photo.cameras)}\n\n"
-            )
+        description = "".join(
+            f"Sol: {photo.sol} - Earth Date: {photo.earth_date}\n"
+            f"Number of Photos: {photo.total_photos} - Cameras: {photo.cameras_str}\n\n"
+            for photo in photos
+        )
         em = discord.Embed(title=self.manifest.name, description=description)
-        em.set_footer(text=f"Page {view.current_page + 1}/{self.get_max_pages()}")
+        em.set_footer(text=self._footers[view.current_page])
         return em
 
 
 class MarsRoverPhotos(menus.ListPageSource):
     def __init__(self, photos: List[RoverPhoto]):
         super().__init__(photos, per_page=1)
+        self._footers = _page_footers(self)
         self.select_options = [
             discord.SelectOption(
                 label=f"Page {i+1}",
@@ -133,37 +214,45 @@ class MarsRoverPhotos(menus.ListPageSource):
             )
             for i, page in enumerate(photos)
         ]
+        self._pages = [
+            {**photo.embed_dict(), "footer": {"text": footer}}
+            for photo, footer in zip(photos, self._footers)
+        ]
 
     async def format_page(self, view: BaseMenu, photo: RoverPhoto):
-        em = photo.embed()
-        em.set_footer(text=f"Page {view.current_page + 1}/{self.get_max_pages()}")
-        return em
+        return discord.Embed.from_dict(self._pages[view.current_page])
 
 
 class NASAEventPages(menus.ListPageSource):
     def __init__(self, events: List[Event]):
         super().__init__(events, per_page=1)
+        self._footers = _page_footers(self)
         self.select_options = [
             discord.SelectOption(label=page.title[:100], value=i) for i, page in enumerate(events)
         ]
+        self._pages = [
+            {**event.embed_dict(), "footer": {"text": footer}}
+            for event, footer in zip(events, self._footers)
+        ]
 
     async def format_page(self, view: BaseMenu, event: Event):
-        em = event.embed()
-        em.set_footer(text=f"Page {view.current_page + 1}/{self.get_max_pages()}")
-        return em
+        return discord.Embed.from_dict(self._pages[view.current_page])
 
 
 class NASAapod(menus.ListPageSource):
     def __init__(self, pages: List[NASAAstronomyPictureOfTheDay]):
         super().__init__(pages, per_page=1)
+        self._footers = _page_footers(self)
         self.select_options = [
             discord.SelectOption(label=page.title[:100], value=i) for i, page in enumerate(pages)
         ]
+        self._pages = [
+            {**page.embed_dict(), "footer": {"text": footer}}
+            for page, footer in zip(pages, self._footers)
+        ]
 
     async def format_page(self, view: BaseMenu, page: NASAAstronomyPictureOfTheDay):
-        em = page.embed()
-        em.set_footer(text=f"Page {view.current_page + 1}/{self.get_max_pages()}")
-        return em
+        return discord.Embed.from_dict(self._pages[view.current_page])
 
 
 class EPICPages(menus.ListPageSource):
@@ -173,119 +262,67 @@ class EPICPages(menus.ListPageSource):
         self.select_options = [
             discord.SelectOption(label=page.identifier, value=i) for i, page in enumerate(pages)
         ]
+        # the distances never change so render every page up front
+        self._pages = [page.embed_dict(enhanced) for page in pages]
 
     async def format_page(self, view: BaseMenu, page: EPICData):
-        return page.embed(self.enhanced)
+        return discord.Embed.from_dict(self._pages[view.current_page])
 
 
-class StopButton(discord.ui.Button):
-    def __init__(
-        self,
-        style: discord.ButtonStyle,
-        row: Optional[int],
-    ):
-        super().__init__(style=style, row=row)
-        self.style = style
-        self.emoji = "\N{HEAVY MULTIPLICATION X}\N{VARIATION SELECTOR-16}"
-
-    async def callback(self, interaction: discord.Interaction):
-        self.view.stop()
-        if interaction.message.flags.ephemeral:
-            await interaction.response.edit_message(view=None)
-            return
-        await interaction.message.delete()
+async def _stop(view: BaseMenu, interaction: discord.Interaction):
+    view.stop()
+    if interaction.message.flags.ephemeral:
+        await interaction.response.edit_message(view=None)
+        return
+    await interaction.message.delete()
 
 
-class ForwardButton(discord.ui.Button):
-    def __init__(
-        self,
-        style: discord.ButtonStyle,
-        row: Optional[int],
-    ):
-        super().__init__(style=style, row=row)
-        self.style = style
-        self.emoji = "\N{BLACK RIGHT-POINTING TRIANGLE}\N{VARIATION SELECTOR-16}"
-
-    async def callback(self, interaction: discord.Interaction):
-        await self.view.show_checked_page(self.view.current_page + 1, interaction=interaction)
-
-
-class BackButton(discord.ui.Button):
-    def __init__(
-        self,
-        style: discord.ButtonStyle,
-        row: Optional[int],
-    ):
-        super().__init__(style=style, row=row)
-        self.style = style
-        self.emoji = "\N{BLACK LEFT-POINTING TRIANGLE}\N{VARIATION SELECTOR-16}"
-
-    async def callback(self, interaction: discord.Interaction):
-        await self.view.show_checked_page(self.view.current_page - 1, interaction=interaction)
+async def _first(view: BaseMenu, interaction: discord.Interaction):
+    await view.show_page(0, interaction=interaction)
 
 
-class LastItemButton(discord.ui.Button):
-    def __init__(
-        self,
-        style: discord.ButtonStyle,
-        row: Optional[int],
-    ):
-        super().__init__(style=style, row=row)
-        self.style = style
-        self.emoji = (
-            "\N{BLACK RIGHT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}\N{VARIATION SELECTOR-16}"
-        )
+async def _back(view: BaseMenu, interaction: discord.Interaction):
+    await view.show_checked_page(view.current_page - 1, interaction=interaction)
 
-    async def callback(self, interaction: discord.Interaction):
-        await self.view.show_page(self.view._source.get_max_pages() - 1, interaction=interaction)
 
+async def _forward(view: BaseMenu, interaction: discord.Interaction):
+    await view.show_checked_page(view.current_page + 1, interaction=interaction)
 
-class FirstItemButton(discord.ui.Button):
-    def __init__(
-        self,
-        style: discord.ButtonStyle,
-        row: Optional[int],
-    ):
-        super().__init__(style=style, row=row)
-        self.style = style
-        self.emoji = (
-            "\N{BLACK LEFT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}\N{VARIATION SELECTOR-16}"
-        )
 
-    async def callback(self, interaction: discord.Interaction):
-        await self.view.show_page(0, interaction=interaction)
+async def _last(view: BaseMenu, interaction: discord.Interaction):
+    await view.show_page(view.max_pages - 1, interaction=interaction)
 
 
-class SkipForwardkButton(discord.ui.Button):
-    def __init__(
-        self,
-        style: discord.ButtonStyle,
-        row: Optional[int],
-    ):
-        super().__init__(style=style, row=row)
-        self.style = style
-        self.emoji = (
-            "\N{BLACK RIGHT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}\N{VARIATION SELECTOR-16}"
-        )
+NavAction = Literal["stop", "first", "back", "forward", "last"]
 
-    async def callback(self, interaction: discord.Interaction):
-        await self.view.show_page(0, skip_next=True, interaction=interaction)
+_NAV_EMOJIS: Dict[str, str] = {
+    "stop": "\N{HEAVY MULTIPLICATION X}\N{VARIATION SELECTOR-16}",
+    "first": "\N{BLACK LEFT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}\N{VARIATION SELECTOR-16}",
+    "back": "\N{BLACK LEFT-POINTING TRIANGLE}\N{VARIATION SELECTOR-16}",
+    "forward": "\N{BLACK RIGHT-POINTING TRIANGLE}\N{VARIATION SELECTOR-16}",
+    "last": "\N{BLACK RIGHT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}\N{VARIATION SELECTOR-16}",
+}
+_NAV_HANDLERS: Dict[str, Callable[[BaseMenu, discord.Interaction], Awaitable[None]]] = {
+    "stop": _stop,
+    "first": _first,
+    "back": _back,
+    "forward": _forward,
+    "last": _last,
+}
 
 
-class SkipBackButton(discord.ui.Button):
+class NavButton(discord.ui.Button):
     def __init__(
         self,
+        action: NavAction,
         style: discord.ButtonStyle,
         row: Optional[int],
     ):
-        super().__init__(style=style, row=row)
-        self.style = style
-        self.emoji = (
-            "\N{BLACK LEFT-POINTING DOUBLE TRIANGLE WITH VERTICAL BAR}\N{VARIATION SELECTOR-16}"
-        )
+        super().__init__(style=style, row=row, emoji=_NAV_EMOJIS[action])
+        self.action = action
 
     async def callback(self, interaction: discord.Interaction):
-        await self.view.show_page(0, skip_prev=True, interaction=interaction)
+        await _NAV_HANDLERS[self.action](self.view, interaction)
 
 
 class SelectMenu(discord.ui.Select):
@@ -316,44 +353,48 @@ class BaseMenu(discord.ui.View):
         self.message: discord.Message = None
         self.page_start = page_start
         self.current_page = page_start
-        self.forward_button = ForwardButton(discord.ButtonStyle.grey, 0)
-        self.back_button = BackButton(discord.ButtonStyle.grey, 0)
-        self.first_item = FirstItemButton(discord.ButtonStyle.grey, 0)
-        self.last_item = LastItemButton(discord.ButtonStyle.grey, 0)
-        self.stop_button = StopButton(discord.ButtonStyle.red, 0)
+        self.max_pages: Optional[int] = None
+        self._allowed_ids: FrozenSet[int] = frozenset()
+        self.stop_button = NavButton("stop", discord.ButtonStyle.red, 0)
         self.add_item(self.stop_button)
-        self.add_item(self.first_item)
-        self.add_item(self.back_button)
-        self.add_item(self.forward_button)
-        self.add_item(self.last_item)
+        self.forward_button: Optional[NavButton] = None
+        self.back_button: Optional[NavButton] = None
+        self.first_item: Optional[NavButton] = None
+        self.last_item: Optional[NavButton] = None
         self.select_options = getattr(self.source, "select_options", [])
-        self.select_menu: Optional[SelectMenu] = self.get_select_menu()
-        if self.select_menu:
-            self.add_item(self.select_menu)
+        self.select_menu: Optional[SelectMenu] = None
+        # single page sources have nothing to navigate so only show the stop button
+        if self.source.is_paginating():
+            self.forward_button = NavButton("forward", discord.ButtonStyle.grey, 0)
+            self.back_button = NavButton("back", discord.ButtonStyle.grey, 0)
+            self.first_item = NavButton("first", discord.ButtonStyle.grey, 0)
+            self.last_item = NavButton("last", discord.ButtonStyle.grey, 0)
+            self.add_item(self.first_item)
+            self.add_item(self.back_button)
+            self.add_item(self.forward_button)
+            self.add_item(self.last_item)
+            self.select_menu = self.get_select_menu()
+            if self.select_menu:
+                self.add_item(self.select_menu)
+
+    def stop(self):
+        self._cancel_prefetch()
+        super().stop()
 
     async def on_timeout(self):
+        self._cancel_prefetch()
         await self.message.edit(view=None)
 
+    def _cancel_prefetch(self):
+        # sources doing background work for later pages can stop with the menu
+        cancel = getattr(self.source, "cancel_prefetch", None)
+        if cancel is not None:
+            cancel()
+
     @property
     def source(self):
         return self._source
 
-    def disable_pagination(self):
-        if not self.source.is_paginating():
-            self.forward_button.disabled = True
-            self.back_button.disabled = True
-            self.first_item.disabled = True
-            self.last_item.disabled = True
-            if self.select_menu:
-                self.select_menu.disabled = True
-        else:
-            self.forward_button.disabled = False
-            self.back_button.disabled = False
-            self.first_item.disabled = False
-            self.last_item.disabled = False
-            if self.select_menu:
-                self.select_menu.disabled = False
-
     def get_select_menu(self):
         # handles modifying the select menu if more than 25 pages are provided
         # this will show the previous 12 and next 13 pages in the select menu
@@ -377,11 +418,13 @@ class BaseMenu(discord.ui.View):
 
     async def start(self, ctx: commands.Context):
         await self.source._prepare_once()
+        self.max_pages = self._source.get_max_pages()
         self.ctx = ctx
+        self._allowed_ids = frozenset((*ctx.bot.owner_ids, ctx.author.id))
         self.message = await self.send_initial_message(ctx)
 
     async def _get_kwargs_from_page(self, page):
-        value = await discord.utils.maybe_coroutine(self.source.format_page, self, page)
+        value = await self.source.format_page(self, page)
         if isinstance(value, dict):
             return value
         elif isinstance(value, str):
@@ -393,8 +436,7 @@ class BaseMenu(discord.ui.View):
         page = await self._source.get_page(page_number)
         self.current_page = page_number
         kwargs = await self._get_kwargs_from_page(page)
-        self.disable_pagination()
-        if self.select_menu and len(self.select_options) > 25 and self.source.is_paginating():
+        if self.select_menu and len(self.select_options) > 25:
             self.remove_item(self.select_menu)
             self.select_menu = self.get_select_menu()
             if self.select_menu:
@@ -409,28 +451,22 @@ class BaseMenu(discord.ui.View):
         """
         page = await self._source.get_page(self.page_start)
         kwargs = await self._get_kwargs_from_page(page)
-        self.disable_pagination()
         return await ctx.send(**kwargs, view=self)
 
     async def show_checked_page(self, page_number: int, interaction: discord.Interaction) -> None:
-        max_pages = self._source.get_max_pages()
+        max_pages = self.max_pages
+        if max_pages:
+            # wrap around past either end, if it doesn't give maximum pages it cannot be checked
+            page_number %= max_pages
         try:
-            if max_pages is None:
-                # If it doesn't give maximum pages, it cannot be checked
-                await self.show_page(page_number, interaction)
-            elif page_number >= max_pages:
-                await self.show_page(0, interaction)
-            elif page_number < 0:
-                await self.show_page(max_pages - 1, interaction)
-            elif max_pages > page_number >= 0:
-                await self.show_page(page_number, interaction)
+            await self.show_page(page_number, interaction)
         except IndexError:
             # An error happened that can be handled, so ignore it.
             pass
 
     async def interaction_check(self, interaction: discord.Interaction):
         """Just extends the default reaction_check to use owner_ids"""
-        if interaction.user.id not in (*self.ctx.bot.owner_ids, self.ctx.author.id):
+        if interaction.user.id not in self._allowed_ids:
             await interaction.response.send_message(
                 content=_("You are not authorized to interact with this."), ephemeral=True
             )
@@ -3,8 +3,10 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import cached_property
 from math import hypot, sqrt
 from typing import Dict, List, NamedTuple, Optional, Union
+from urllib.parse import quote
 
 import aiohttp
 import discord
@@ -12,7 +14,7 @@ import skyfield
 from red_commons.logging import getLogger
 from redbot.core import commands
 from redbot.core.i18n import Translator
-from redbot.core.utils.chat_formatting import humanize_number
+from redbot.core.utils.chat_formatting import humanize_list, humanize_number
 from skyfield.api import load
 from skyfield.toposlib import wgs84
 
@@ -23,6 +25,11 @@ log = getLogger("red.trusty-cogs.NASACog")
 HEADERS = {"User-Agent": "Trusty-cogs NASA cog for Red-DiscordBot"}
 
 
+def quote_url(url: str) -> str:
+    """Percent encodes unsafe characters like spaces while leaving existing escapes alone"""
+    return quote(url, safe=":/?#[]@!$&'()*+,;=%")
+
+
 class APIError(Exception):
     pass
 
@@ -677,6 +684,10 @@ class ManifestPhoto:
     total_photos: int
     cameras: List[str]
 
+    @cached_property
+    def cameras_str(self) -> str:
+        return humanize_list(self.cameras)
+
 
 @dataclass
 class PhotoManifest:
@@ -724,12 +735,16 @@ class RoverPhoto:
     def from_json(cls, data: dict) -> RoverPhoto:
         return cls(camera=Camera(**data.pop("camera")), rover=Rover(**data.pop("rover")), **data)
 
+    def embed_dict(self) -> dict:
+        return {
+            "type": "rich",
+            "title": f"{self.camera.full_name} on {self.rover.name}",
+            "description": f"Sol: {self.sol}\nEarth Date: {self.earth_date}",
+            "image": {"url": self.img_src},
+        }
+
     def embed(self):
-        title = f"{self.camera.full_name} on {self.rover.name}"
-        description = f"Sol: {self.sol}\nEarth Date: {self.earth_date}"
-        em = discord.Embed(title=title, description=description)
-        em.set_image(url=self.img_src)
-        return em
+        return discord.Embed.from_dict(self.embed_dict())
 
 
 class Category(NamedTuple):
@@ -795,31 +810,51 @@ class Event:
         date_str = date.strftime("%Y-%m-%d")
         return f"https://gibs.earthdata.nasa.gov/wmts/epsg4326/best/MODIS_Terra_CorrectedReflectance_TrueColor/default/{date_str}/250m/3/{row}/{col}.jpg"
 
-    def embed(self):
-        em = discord.Embed(title=self.title, description=self.description)
-        em.set_image(url=self.image_url)
+    @property
+    def coordinates_value(self) -> str:
         coordinates = self.geometry[-1].coordinates
         lat = coordinates[1]
         lon = coordinates[0]
         maps_url = f"https://www.google.com/maps/search/?api=1&query={lat}%2C{lon}"
-        coords = f"[Latitude: {lat}\nLongitude: {lon}]({maps_url})"
-        em.add_field(name="Coordinates", value=coords)
-        value = ""
-        for geometry in reversed(self.geometry):
-            if len(value) >= 512:
-                break
+        return f"[Latitude: {lat}\nLongitude: {lon}]({maps_url})"
+
+    @property
+    def data_value(self) -> str:
+        parts = []
+        length = 0
+        # newest first, stopping before the field grows past 512 characters
+        for i in range(len(self.geometry) - 1, -1, -1):
+            geometry = self.geometry[i]
             if geometry.magnitudeValue is None:
                 continue
             timestamp = discord.utils.format_dt(geometry.date)
-            value += f"{geometry.magnitudeValue} {geometry.magnitudeUnit} - {timestamp}\n"
-        if value:
-            em.add_field(name="Data", value=value)
-        sources = ""
-        for source in self.sources:
-            sources += f"[{source.id}]({source.url})\n"
-        if sources:
-            em.add_field(name="Sources", value=sources)
-        return em
+            piece = f"{geometry.magnitudeValue} {geometry.magnitudeUnit} - {timestamp}\n"
+            if length + len(piece) > 512:
+                break
+            parts.append(piece)
+            length += len(piece)
+        return "".join(parts)
+
+    @property
+    def sources_value(self) -> str:
+        return "".join(f"[{source.id}]({source.url})\n" for source in self.sources)
+
+    def embed_dict(self) -> dict:
+        fields = [{"name": "Coordinates", "value": self.coordinates_value, "inline": True}]
+        if value := self.data_value:
+            fields.append({"name": "Data", "value": value, "inline": True})
+        if sources := self.sources_value:
+            fields.append({"name": "Sources", "value": sources, "inline": True})
+        return {
+            "type": "rich",
+            "title": self.title,
+            "description": self.description,
+            "image": {"url": self.image_url},
+            "fields": fields,
+        }
+
+    def embed(self):
+        return discord.Embed.from_dict(self.embed_dict())
 
 
 class CentroidCoords(NamedTuple):
@@ -907,18 +942,27 @@ class EPICData:
     def get_distance(self, distance: float) -> str:
         return f"{humanize_number(int(distance))} km ({humanize_number(int(distance*0.621371))} Miles)"
 
-    def embed(self, enhanced: bool = False) -> discord.Embed:
-        url = self.natural_url if not enhanced else self.enhanced_url
-        description = (
+    @property
+    def description(self) -> str:
+        return (
             f"{self.caption}\n\n"
             f"Distance from Earth: {self.get_distance(self.coords.dscovr_j2000_position.distance)}\n"
             f"Distance from Sun: {self.get_distance(self.coords.sun_j2000_position.distance)}\n"
             f"Distance from Moon: {self.get_distance(self.coords.lunar_j2000_position.distance)}\n"
         )
 
-        em = discord.Embed(title=self.identifier, description=description, url=url)
-        em.set_image(url=url)
-        return em
+    def embed_dict(self, enhanced: bool = False) -> dict:
+        url = self.natural_url if not enhanced else self.enhanced_url
+        return {
+            "type": "rich",
+            "title": self.identifier,
+            "description": self.description,
+            "url": url,
+            "image": {"url": url},
+        }
+
+    def embed(self, enhanced: bool = False) -> discord.Embed:
+        return discord.Embed.from_dict(self.embed_dict(enhanced))
 
 
 @dataclass
@@ -1012,18 +1056,29 @@ class NASAAstronomyPictureOfTheDay:
     ) -> NASAAstronomyPictureOfTheDay:
         return await cls.get(api_key, session=session)  # type: ignore
 
-    def embed(self) -> discord.Embed:
-        em = discord.Embed(
-            title=self.title, description=self.explanation, timestamp=self.date, url=self.url
-        )
-        em.set_image(url=self.url)
+    def embed_dict(self) -> dict:
+        data = {
+            "type": "rich",
+            "title": self.title,
+            "description": self.explanation,
+            "timestamp": self.date.astimezone().isoformat(),
+            "url": self.url,
+            "image": {"url": self.url},
+        }
         if self.thumbnail_url:
-            em.set_thumbnail(url=self.thumbnail_url)
+            data["thumbnail"] = {"url": self.thumbnail_url}
+        fields = []
         if self.copyright:
-            em.add_field(name="Copyright (c)", value=self.copyright)
+            fields.append({"name": "Copyright (c)", "value": self.copyright, "inline": True})
         if self.hdurl:
-            em.add_field(name="HD URL", value=f"[Click here]({self.hdurl})")
-        return em
+            hd_link = f"[Click here]({self.hdurl})"
+            fields.append({"name": "HD URL", "value": hd_link, "inline": True})
+        if fields:
+            data["fields"] = fields
+        return data
+
+    def embed(self) -> discord.Embed:
+        return discord.Embed.from_dict(self.embed_dict())
 
 
 @dataclass
@@ -1035,7 +1090,8 @@ class Links:
 
     @classmethod
     def from_json(cls, data: dict) -> Links:
-        return cls(**data)
+        href = data.pop("href")
+        return cls(href=quote_url(href), **data)
 
 
 @dataclass